@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import List, Literal, TypedDict
 from urllib.request import Request, urlopen
+import logging
 import re
+import threading
 
+import httpx
 import numpy as np
 
 try:
@@ -12,15 +17,27 @@ try:
 except Exception:
     cv2 = None
 
+try:
+    import tesserocr
+    from PIL import Image
+except Exception:
+    tesserocr = None
+
 try:
     import pytesseract
 except Exception:
     pytesseract = None
 
 try:
-    import Levenshtein
+    from rapidfuzz import fuzz, process
 except Exception:
-    Levenshtein = None
+    fuzz = None
+    process = None
+
+# Minimum per-token similarity (0-100, rapidfuzz scale) for a fuzzy name match.
+TOKEN_FUZZY_CUTOFF = 82.0
+
+logger = logging.getLogger("kyc-id-validator")
 
 
 @dataclass
@@ -39,6 +56,35 @@ class ImageCheck(TypedDict):
     detail: str
 
 
+# Code points below this (Latin through Arabic scripts) get a precomputed
+# keep/delete entry in _CharFilter tables; rarer ones are decided per lookup.
+CHAR_FILTER_TABLE_SIZE = 0x800
+
+
+class _CharFilter(dict):
+    """
+    str.translate() table that keeps characters accepted by `keep` and deletes
+    the rest. Entries for common code points are built up front, so the table
+    never grows with caller-controlled input.
+    """
+
+    def __init__(self, keep) -> None:
+        super().__init__(
+            (code_point, code_point if keep(chr(code_point)) else None)
+            for code_point in range(CHAR_FILTER_TABLE_SIZE)
+        )
+        self._keep = keep
+
+    def __missing__(self, code_point: int) -> int | None:
+        return code_point if self._keep(chr(code_point)) else None
+
+
+_ALPHA_CHARS = _CharFilter(str.isalpha)
+
+# Characters stripped from names before matching
+NAME_DISALLOWED_PATTERN = re.compile(r"[^a-zA-Z\s]")
+
+
 # ─── ID Type Config ────────────────────────────────────────────────────────────
 # Maps normalized ID type → expected digit count (digits only, no dashes)
 ID_DIGIT_REQUIREMENTS: dict[str, int] = {
@@ -55,6 +101,139 @@ ID_DIGIT_REQUIREMENTS: dict[str, int] = {
 }
 
 
+# Longest image side used for analysis. Phone photos are often 3000-4000 px;
+# the quality/shape heuristics and OCR do not need more than this.
+ANALYSIS_MAX_DIMENSION = 1600
+
+IMAGE_FETCH_USER_AGENT = "Mozilla/5.0"
+IMAGE_FETCH_TIMEOUT = 10.0
+
+# Downloads larger than this are decoded at half resolution, provided the result
+# is still at least REDUCED_DECODE_MIN_WIDTH pixels wide.
+REDUCED_DECODE_MIN_BYTES = 1_000_000
+REDUCED_DECODE_MIN_WIDTH = 800
+
+
+# Run the preprocessing filters on an OpenCL device (e.g. an integrated GPU)
+# through cv2.UMat when the OpenCV build and host support it.
+USE_OPENCL = cv2 is not None and cv2.ocl.haveOpenCL()
+if USE_OPENCL:
+    cv2.ocl.setUseOpenCL(True)
+
+# CLAHE runs on the GPU when OpenCV is built with CUDA and a device is present.
+USE_CUDA = cv2 is not None and hasattr(cv2, "cuda") and cv2.cuda.getCudaEnabledDeviceCount() > 0
+_CLAHE_LOCAL = threading.local()
+
+
+def _load_face_cascade():
+    """Frontal-face Haar cascade, or None when this OpenCV build cannot provide one."""
+    if cv2 is None:
+        return None
+    haar_data = getattr(cv2, "data", None)
+    haar_base_path = getattr(haar_data, "haarcascades", "")
+    try:
+        cascade = cv2.CascadeClassifier(haar_base_path + "haarcascade_frontalface_default.xml")
+    except Exception as exc:
+        # e.g. OpenCV 5 moved CascadeClassifier out of the main package
+        logger.warning("Face detection unavailable: %s", exc)
+        return None
+    if cascade.empty():
+        logger.warning("Face detection unavailable: Haar cascade file could not be loaded.")
+        return None
+    return cascade
+
+
+# Wide, short kernel that highlights printed text lines in _estimate_text_density.
+TEXT_DENSITY_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (17, 5)) if cv2 is not None else None
+
+# Parsed once at import; re-reading the cascade XML on every request is wasteful.
+FACE_CASCADE = _load_face_cascade()
+
+
+# ─── Tesseract ─────────────────────────────────────────────────────────────────
+# Page segmentation modes used by the OCR passes.
+PSM_OSD_ONLY = 0
+PSM_SINGLE_BLOCK = 6
+PSM_SPARSE_TEXT = 11
+
+# Minimum Tesseract OSD orientation confidence before its answer is trusted.
+OSD_MIN_CONFIDENCE = 2.0
+
+# In-process Tesseract engines (tesserocr), pooled per PSM. An engine is checked
+# out for one call and returned afterwards, so concurrent passes each get their
+# own engine and the language model is only loaded once per pooled engine.
+# Tesseract only ever runs on _OCR_POOL threads, so each PSM holds at most as
+# many engines as the pool has workers.
+_TESS_IDLE_APIS: dict[int, list] = {}
+_TESS_POOL_LOCK = threading.Lock()
+
+# Runs the independent OCR passes of one attempt concurrently; Tesseract releases
+# the GIL while recognizing.
+_OCR_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix="ocr")
+
+
+def _ocr_available() -> bool:
+    return tesserocr is not None or pytesseract is not None
+
+
+@contextmanager
+def _tess_api(psm: int):
+    with _TESS_POOL_LOCK:
+        idle = _TESS_IDLE_APIS.setdefault(psm, [])
+        api = idle.pop() if idle else None
+    if api is None:
+        api = tesserocr.PyTessBaseAPI(lang="eng", psm=psm)
+    try:
+        yield api
+    finally:
+        with _TESS_POOL_LOCK:
+            _TESS_IDLE_APIS[psm].append(api)
+
+
+def _run_tesseract(image: np.ndarray, psm: int) -> str:
+    """OCR a single preprocessed image, preferring the in-process tesserocr engine."""
+    if tesserocr is not None:
+        with _tess_api(psm) as api:
+            api.SetImage(Image.fromarray(image))
+            return api.GetUTF8Text()
+    return pytesseract.image_to_string(image, config=f"--psm {psm} --oem 3")
+
+
+def _detect_rotation(gray_image: np.ndarray) -> int | None:
+    """
+    Use Tesseract orientation detection (OSD) to find the clockwise rotation
+    (0/90/180/270) that makes the text upright. Returns None when OSD fails
+    or is not confident enough.
+    """
+    try:
+        if tesserocr is not None:
+            with _tess_api(PSM_OSD_ONLY) as api:
+                api.SetImage(Image.fromarray(gray_image))
+                osd = api.DetectOrientationScript()
+            if not osd:
+                return None
+            rotate, confidence = (360 - int(osd["orient_deg"])) % 360, float(osd["orient_conf"])
+        else:
+            osd = pytesseract.image_to_osd(gray_image, output_type=pytesseract.Output.DICT)
+            rotate, confidence = int(osd["rotate"]) % 360, float(osd["orientation_conf"])
+    except Exception:
+        return None
+
+    if confidence < OSD_MIN_CONFIDENCE or rotate not in (0, 90, 180, 270):
+        return None
+    return rotate
+
+
+def _rotate_clockwise(image: np.ndarray, angle: int) -> np.ndarray:
+    if angle == 90:
+        return cv2.rotate(image, cv2.ROTATE_90_CLOCKWISE)
+    if angle == 180:
+        return cv2.rotate(image, cv2.ROTATE_180)
+    if angle == 270:
+        return cv2.rotate(image, cv2.ROTATE_90_COUNTERCLOCKWISE)
+    return image
+
+
 def _normalize_id_type(id_type: str | None) -> str:
     if not id_type:
         return "Others"
@@ -77,77 +256,155 @@ def _validate_id_number_format(id_number: str | None, id_type: str) -> tuple[boo
     if not id_number:
         return (True, "No ID number provided for format check.")
 
-    # Strip all non-digit characters for counting
-    digits_only = re.sub(r'\D', '', id_number)
     expected = ID_DIGIT_REQUIREMENTS.get(id_type)
 
     if expected is None:
         return (True, f"No digit requirement defined for {id_type}.")
 
-    if len(digits_only) == expected:
+    # Only the number of digits matters, not the digits themselves
+    digit_count = sum(map(str.isdecimal, id_number))
+
+    if digit_count == expected:
         return (True, f"{id_type} number has correct {expected}-digit format.")
     else:
         return (
             False,
             f"{id_type} number must have exactly {expected} digits "
-            f"(found {len(digits_only)} digits in '{id_number}')."
+            f"(found {digit_count} digits in '{id_number}')."
         )
 
 
+def create_http_client() -> httpx.AsyncClient:
+    """Shared keep-alive client for image downloads; close it on shutdown."""
+    return httpx.AsyncClient(
+        headers={"User-Agent": IMAGE_FETCH_USER_AGENT},
+        timeout=IMAGE_FETCH_TIMEOUT,
+        follow_redirects=True,
+        http2=True,
+    )
+
+
+async def fetch_image_bytes(image_url: str, client: httpx.AsyncClient) -> bytes:
+    response = await client.get(image_url)
+    response.raise_for_status()
+    return response.content
+
+
 def _download_image(image_url: str) -> np.ndarray:
+    request = Request(image_url, headers={"User-Agent": IMAGE_FETCH_USER_AGENT})
+    with urlopen(request, timeout=IMAGE_FETCH_TIMEOUT) as response:
+        raw_bytes = response.read()
+    return _decode_image(raw_bytes)
+
+
+def _decode_image(raw_bytes: bytes) -> np.ndarray:
     if cv2 is None:
         raise RuntimeError("OpenCV is not available.")
-    request = Request(image_url, headers={"User-Agent": "Mozilla/5.0"})
-    with urlopen(request, timeout=10) as response:
-        raw_bytes = response.read()
-    byte_array = np.asarray(bytearray(raw_bytes), dtype=np.uint8)
-    image = cv2.imdecode(byte_array, cv2.IMREAD_COLOR)
+    byte_array = np.frombuffer(raw_bytes, dtype=np.uint8)
+    image = None
+    if len(raw_bytes) > REDUCED_DECODE_MIN_BYTES:
+        # Large phone photos: let the JPEG decoder produce a half-size image
+        # directly, unless that would be too small to analyze.
+        image = cv2.imdecode(byte_array, cv2.IMREAD_REDUCED_COLOR_2)
+        if image is not None and image.shape[1] < REDUCED_DECODE_MIN_WIDTH:
+            image = None
+    if image is None:
+        image = cv2.imdecode(byte_array, cv2.IMREAD_COLOR)
     if image is None:
         raise ValueError("Could not decode image from URL.")
     return image
 
 
+def _as_umat(image: np.ndarray):
+    """Wrap for OpenCV's transparent API so supported ops run via OpenCL when available."""
+    return cv2.UMat(image) if USE_OPENCL else image
+
+
+def _as_array(image) -> np.ndarray:
+    return image.get() if isinstance(image, cv2.UMat) else image
+
+
+def _apply_clahe(gray_image):
+    """
+    CLAHE contrast enhancement, on the GPU when OpenCV has CUDA support.
+    CLAHE objects keep internal buffers and are not thread-safe, so each
+    thread reuses its own instead of building one per call.
+    """
+    clahe = getattr(_CLAHE_LOCAL, "clahe", None)
+    if clahe is None:
+        factory = cv2.cuda.createCLAHE if USE_CUDA else cv2.createCLAHE
+        clahe = factory(clipLimit=2.0, tileGridSize=(8, 8))
+        _CLAHE_LOCAL.clahe = clahe
+    if USE_CUDA:
+        gpu_image = cv2.cuda_GpuMat()
+        gpu_image.upload(_as_array(gray_image))
+        return clahe.apply(gpu_image, cv2.cuda.Stream_Null()).download()
+    return clahe.apply(gray_image)
+
+
+def _limit_image_size(image: np.ndarray, max_dimension: int = ANALYSIS_MAX_DIMENSION) -> np.ndarray:
+    """Downscale so the longest side is at most max_dimension (never upscales)."""
+    height, width = image.shape[:2]
+    longest_side = max(height, width)
+    if longest_side <= max_dimension:
+        return image
+    scale = max_dimension / longest_side
+    return cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+
 def _detect_document_like_shape(gray_image: np.ndarray) -> bool:
     if cv2 is None:
         return False
     height, width = gray_image.shape[:2]
     image_area = float(height * width)
-    blurred = cv2.GaussianBlur(gray_image, (5, 5), 0)
+    blurred = cv2.GaussianBlur(_as_umat(gray_image), (5, 5), 0)
 
     for thresh1, thresh2, eps_factor in [(40, 130, 0.02), (30, 100, 0.03)]:
         edges = cv2.Canny(blurred, threshold1=thresh1, threshold2=thresh2)
-        contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        for contour in contours:
+        # Contours come back as UMat for UMat input; fit polygons on host arrays
+        contours, _ = cv2.findContours(_as_array(edges), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        # Largest first: once a contour is below the minimum card area, none of
+        # the remaining ones can qualify, so polygon fitting stops there.
+        by_area = sorted(((cv2.contourArea(contour), contour) for contour in contours),
+                         key=lambda item: item[0], reverse=True)
+        for area, contour in by_area:
+            area_ratio = area / image_area
+            if area <= 0 or area_ratio < 0.15:
+                break
+            if area_ratio > 0.95:
+                continue
             perimeter = cv2.arcLength(contour, True)
             approx = cv2.approxPolyDP(contour, eps_factor * perimeter, True)
             if len(approx) == 4:
-                area = cv2.contourArea(contour)
-                if area > 0 and 0.15 <= area / image_area <= 0.95:
-                    return True
+                return True
     return False
 
 
 def _estimate_text_density(gray_image: np.ndarray) -> float:
     if cv2 is None:
         return 0.0
-    blackhat = cv2.morphologyEx(
-        gray_image,
-        cv2.MORPH_BLACKHAT,
-        cv2.getStructuringElement(cv2.MORPH_RECT, (17, 5)),
-    )
+    total_pixels = gray_image.size
+    if total_pixels == 0:
+        return 0.0
+    blackhat = cv2.morphologyEx(_as_umat(gray_image), cv2.MORPH_BLACKHAT, TEXT_DENSITY_KERNEL)
     _, threshold = cv2.threshold(blackhat, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-    total_pixels = float(gray_image.shape[0] * gray_image.shape[1])
-    return float(np.count_nonzero(threshold)) / total_pixels if total_pixels > 0 else 0.0
+    return float(cv2.countNonZero(threshold)) / float(total_pixels)
 
 
 def _compute_quality_metrics(gray_image: np.ndarray) -> dict[str, float]:
     if cv2 is None:
         return {"brightness": 0.0, "contrast": 0.0, "sharpness": 0.0, "edge_density": 0.0}
-    brightness = float(np.mean(gray_image))
-    contrast = float(np.std(gray_image))
-    sharpness = float(cv2.Laplacian(gray_image, cv2.CV_64F).var())
-    edges = cv2.Canny(gray_image, 40, 130)
-    edge_density = float(np.count_nonzero(edges)) / float(gray_image.size)
+    source = _as_umat(gray_image)
+    # meanStdDev returns UMat outputs for UMat input
+    mean, std_dev = (_as_array(stat) for stat in cv2.meanStdDev(source))
+    brightness = float(mean[0, 0])
+    contrast = float(std_dev[0, 0])
+    # A 3x3 Laplacian of uint8 input fits in int16, so CV_16S is exact and a
+    # quarter of the size of the CV_64F buffer.
+    _, laplacian_std = cv2.meanStdDev(cv2.Laplacian(source, cv2.CV_16S))
+    sharpness = float(_as_array(laplacian_std)[0, 0]) ** 2
+    edges = cv2.Canny(source, 40, 130)
+    edge_density = float(cv2.countNonZero(edges)) / float(gray_image.size)
     return {"brightness": brightness, "contrast": contrast, "sharpness": sharpness, "edge_density": edge_density}
 
 
@@ -163,34 +420,38 @@ def _extract_text_from_image(image: np.ndarray) -> str:
 
     Strategy: run multiple preprocessing passes and concatenate unique results.
     """
-    if pytesseract is None or cv2 is None:
+    if not _ocr_available() or cv2 is None:
         return ""
 
     def _ocr_attempt(img: np.ndarray) -> str:
         """Single OCR attempt with multiple preprocessing passes."""
-        if cv2 is None or pytesseract is None:
+        if cv2 is None or not _ocr_available():
             return ""
         try:
             gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) if len(img.shape) == 3 else img.copy()
 
             # ── Pass 1: upscale + OTSU threshold (best for printed dark text on light bg) ──
             scale = max(1, 2000 // gray.shape[1])
-            upscaled = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
-            denoised = cv2.fastNlMeansDenoising(upscaled, h=10)
+            upscaled = cv2.resize(_as_umat(gray), None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
+            # Edge-preserving bilateral filter: far cheaper than non-local means
+            # and keeps glyph edges crisp for Tesseract's LSTM engine.
+            denoised = cv2.bilateralFilter(upscaled, d=5, sigmaColor=35, sigmaSpace=35)
             _, otsu = cv2.threshold(denoised, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-            text1 = pytesseract.image_to_string(otsu, config='--psm 6 --oem 3')
 
             # ── Pass 2: upscale + sharpening (catches slightly blurry text) ──
             kernel = np.array([[0, -1, 0], [-1, 5, -1], [0, -1, 0]])
             sharpened = cv2.filter2D(denoised, -1, kernel)
             _, otsu2 = cv2.threshold(sharpened, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-            text2 = pytesseract.image_to_string(otsu2, config='--psm 11 --oem 3')
 
             # ── Pass 3: CLAHE contrast enhancement (helps on holographic backgrounds) ──
-            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-            enhanced = clahe.apply(upscaled)
+            enhanced = _apply_clahe(upscaled)
             _, otsu3 = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-            text3 = pytesseract.image_to_string(otsu3, config='--psm 6 --oem 3')
+
+            text1, text2, text3 = _OCR_POOL.map(
+                _run_tesseract,
+                [_as_array(otsu), _as_array(otsu2), _as_array(otsu3)],
+                [PSM_SINGLE_BLOCK, PSM_SPARSE_TEXT, PSM_SINGLE_BLOCK],
+            )
 
             combined = "\n".join(filter(None, [text1, text2, text3]))
             return combined.strip()
@@ -202,7 +463,7 @@ def _extract_text_from_image(image: np.ndarray) -> str:
         if not text or len(text) < 10:
             return 0.0
         # Count alphabetic characters vs total length
-        alpha_count = sum(c.isalpha() for c in text)
+        alpha_count = len(text.translate(_ALPHA_CHARS))
         if len(text) == 0:
             return 0.0
         alpha_ratio = alpha_count / len(text)
@@ -213,11 +474,19 @@ def _extract_text_from_image(image: np.ndarray) -> str:
         return alpha_ratio * word_count
 
     try:
-        # Try original orientation first
+        # Detect orientation once with OSD and OCR only the upright image
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+        # On _OCR_POOL like every other Tesseract call, which bounds the pooled engines
+        rotation = _OCR_POOL.submit(_detect_rotation, gray).result()
+        if rotation is not None:
+            logger.debug("OSD detected rotation: %d°", rotation)
+            return _ocr_attempt(_rotate_clockwise(image, rotation))
+
+        # OSD unavailable or unsure — fall back to probing orientations
         text_original = _ocr_attempt(image)
         score_original = _text_quality_score(text_original)
         
-        print(f"🔄 OCR attempt (0°): score={score_original:.1f}, text_len={len(text_original)}", flush=True)
+        logger.debug("OCR attempt (0°): score=%.1f, text_len=%d", score_original, len(text_original))
 
         # If original OCR produced poor results, try rotating (handles vertical IDs)
         if score_original < 5.0:  # Low quality threshold
@@ -225,21 +494,16 @@ def _extract_text_from_image(image: np.ndarray) -> str:
             best_score = score_original
 
             for angle in [90, 270, 180]:
-                if angle == 90:
-                    rotated = cv2.rotate(image, cv2.ROTATE_90_CLOCKWISE)
-                elif angle == 270:
-                    rotated = cv2.rotate(image, cv2.ROTATE_90_COUNTERCLOCKWISE)
-                else:  # 180
-                    rotated = cv2.rotate(image, cv2.ROTATE_180)
+                rotated = _rotate_clockwise(image, angle)
 
                 text_rotated = _ocr_attempt(rotated)
                 score_rotated = _text_quality_score(text_rotated)
-                print(f"🔄 OCR attempt ({angle}°): score={score_rotated:.1f}, text_len={len(text_rotated)}", flush=True)
+                logger.debug("OCR attempt (%d°): score=%.1f, text_len=%d", angle, score_rotated, len(text_rotated))
 
                 if score_rotated > best_score:
                     best_score = score_rotated
                     best_text = text_rotated
-                    print(f"✅ Better OCR found at {angle}° rotation!", flush=True)
+                    logger.debug("Better OCR found at %d° rotation", angle)
 
             return best_text
 
@@ -250,25 +514,22 @@ def _extract_text_from_image(image: np.ndarray) -> str:
 
 
 def _normalize_name(name: str) -> str:
-    normalized = re.sub(r'[^a-zA-Z\s]', '', name)
+    normalized = NAME_DISALLOWED_PATTERN.sub("", name)
     return normalized.lower().strip()
 
 
 def _match_name(ocr_text: str, user_name: str) -> tuple[bool, float, str]:
     """
-    Order-independent name matching using token matching + Levenshtein fuzzy match.
+    Order-independent name matching using token matching + rapidfuzz fuzzy match.
     Handles Filipino names where OCR order may differ from user input.
     """
-    import logging
-    logger = logging.getLogger("kyc-id-validator")
-
     if not user_name:
         return (True, 0.5, "Name verification skipped (no name provided).")
 
     if not ocr_text or len(ocr_text.strip()) < 5:
         return (True, 0.2, "Name verification unavailable (OCR extraction failed — manual review required).")
 
-    if Levenshtein is None:
+    if process is None:
         return (True, 0.5, "Name matching library not available (manual verification required).")
 
     user_normalized = _normalize_name(user_name)
@@ -277,33 +538,24 @@ def _match_name(ocr_text: str, user_name: str) -> tuple[bool, float, str]:
     if not user_tokens:
         return (True, 0.5, "User name format issue (manual verification required).")
 
-    ocr_normalized = _normalize_name(ocr_text)
+    # Normalize the OCR text once; newlines survive normalization, so the
+    # per-line view used for full-name matching is just a split of this.
+    ocr_normalized = NAME_DISALLOWED_PATTERN.sub("", ocr_text).lower()
     ocr_tokens = set(ocr_normalized.split())
 
-    import sys
-    debug_msg = f"\n{'='*60}\n"
-    debug_msg += f"🔍 NAME MATCHING DEBUG\n"
-    debug_msg += f"{'='*60}\n"
-    debug_msg += f"User name: '{user_name}'\n"
-    debug_msg += f"User tokens: {user_tokens}\n"
-    debug_msg += f"OCR extracted text:\n{ocr_text[:500]}\n"
-    debug_msg += f"OCR tokens (first 30): {list(ocr_tokens)[:30]}\n"
-    debug_msg += f"{'='*60}\n\n"
-    
-    print(debug_msg, flush=True)
-    sys.stdout.flush()
-    
-    try:
-        with open("C:/temp/name_match_debug.txt", "w", encoding="utf-8") as f:
-            f.write(debug_msg)
-            f.write(f"Full OCR text:\n{ocr_text}\n\n")
-            f.write(f"All OCR tokens: {sorted(list(ocr_tokens))}\n")
-    except Exception:
-        pass
-    
+    logger.debug("OCR extracted text:\n%s", ocr_text[:500])
     logger.info(f"Name matching: user='{user_name}', user_tokens={user_tokens}")
     logger.info(f"OCR tokens (sample): {list(ocr_tokens)[:30]}")
 
+    # Score every long user token against every OCR token in one batched call;
+    # scores below the cutoff come back as 0.
+    ocr_token_list = list(ocr_tokens)
+    long_tokens = [token for token in user_tokens if len(token) >= 3]
+    best_fuzzy: dict[str, float] = {}
+    if long_tokens and ocr_token_list:
+        scores = process.cdist(long_tokens, ocr_token_list, scorer=fuzz.ratio, score_cutoff=TOKEN_FUZZY_CUTOFF)
+        best_fuzzy = {token: float(row.max()) / 100.0 for token, row in zip(long_tokens, scores)}
+
     matched_tokens = []
     unmatched_tokens = []
 
@@ -323,8 +575,8 @@ def _match_name(ocr_text: str, user_name: str) -> tuple[bool, float, str]:
                 token_matched = True
             else:
                 # Fuzzy per-token: allow 1 char difference for OCR misread
-                best = max((Levenshtein.ratio(token, t) for t in ocr_tokens), default=0.0)
-                if best >= 0.82:
+                best = best_fuzzy.get(token, 0.0)
+                if best > 0.0:
                     matched_tokens.append((token, f"fuzzy({best:.0%})"))
                     token_matched = True
 
@@ -334,49 +586,25 @@ def _match_name(ocr_text: str, user_name: str) -> tuple[bool, float, str]:
     match_ratio = len(matched_tokens) / len(user_tokens) if user_tokens else 0.0
 
     # Full-name fuzzy across every OCR line
-    max_similarity = 0.0
-    for line in ocr_text.split('\n'):
-        line_norm = _normalize_name(line)
-        if len(line_norm) >= len(user_normalized) * 0.4:
-            sim = Levenshtein.ratio(user_normalized, line_norm)
-            max_similarity = max(max_similarity, sim)
+    min_line_length = len(user_normalized) * 0.4
+    candidate_lines = [
+        line_norm
+        for line_norm in (line.strip() for line in ocr_normalized.split('\n'))
+        if len(line_norm) >= min_line_length
+    ]
+    best_line = process.extractOne(user_normalized, candidate_lines, scorer=fuzz.ratio, processor=None)
+    max_similarity = best_line[1] / 100.0 if best_line else 0.0
 
     logger.info(f"match_ratio={match_ratio:.0%}, max_similarity={max_similarity:.0%}, unmatched={unmatched_tokens}")
-
-    result_msg = f"📊 MATCHING RESULTS:\n"
-    result_msg += f"   Matched tokens: {matched_tokens}\n"
-    result_msg += f"   Unmatched tokens: {unmatched_tokens}\n"
-    result_msg += f"   Match ratio: {match_ratio:.0%}\n"
-    result_msg += f"   Max similarity: {max_similarity:.0%}\n"
-    print(result_msg, flush=True)
-    
-    try:
-        with open("C:/temp/name_match_debug.txt", "a", encoding="utf-8") as f:
-            f.write(f"\n{result_msg}\n")
-    except Exception:
-        pass
+    logger.debug("Matched tokens: %s", matched_tokens)
 
     # ── Decision: 60% token match OR 65% full-name similarity ──
     # (Lowered from 70%/65% to accommodate OCR noise on Philippine IDs)
     if match_ratio >= 0.60 or max_similarity >= 0.65:
         confidence = max(match_ratio, max_similarity)
-        decision_msg = f"✅ DECISION: VALID (confidence: {confidence:.0%})\n"
-        print(decision_msg, flush=True)
-        try:
-            with open("C:/temp/name_match_debug.txt", "a", encoding="utf-8") as f:
-                f.write(decision_msg)
-        except Exception:
-            pass
         return (True, confidence, f"Name match found (confidence: {confidence:.0%}).")
     else:
         confidence = max(match_ratio, max_similarity)
-        decision_msg = f"❌ DECISION: INVALID (confidence: {confidence:.0%})\n"
-        print(decision_msg, flush=True)
-        try:
-            with open("C:/temp/name_match_debug.txt", "a", encoding="utf-8") as f:
-                f.write(decision_msg)
-        except Exception:
-            pass
         return (False, confidence, "Name mismatch detected (ID may not belong to applicant).")
 
 
@@ -385,9 +613,8 @@ def analyze_id_image(
     id_type: str | None = None,
     user_name: str | None = None,
     id_number: str | None = None,       # ← NEW optional param
+    image_bytes: bytes | None = None,   # already-fetched image; skips the download
 ) -> ImageAnalysisResult:
-    import logging
-    logger = logging.getLogger("kyc-id-validator")
     logger.info(f"analyze_id_image: user_name='{user_name}', id_type='{id_type}', id_number='{id_number}'")
 
     normalized_id_type = _normalize_id_type(id_type)
@@ -396,21 +623,20 @@ def analyze_id_image(
         msg = "Image analysis dependency is not available on the server."
         return ImageAnalysisResult(status="Invalid", category="unknown", message=msg, reasons=[msg], checks=[], confidence=0.0)
 
-    image = _download_image(image_url)
+    image = _download_image(image_url) if image_bytes is None else _decode_image(image_bytes)
+    image = _limit_image_size(image)
     gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
     quality = _compute_quality_metrics(gray)
     text_density = _estimate_text_density(gray)
 
-    ocr_text = _extract_text_from_image(image) if user_name else ""
-    name_match_result = _match_name(ocr_text, user_name) if user_name else None
-
     # ── ID Number format validation ──
     id_format_valid, id_format_detail = _validate_id_number_format(id_number, normalized_id_type)
 
-    haar_data = getattr(cv2, "data", None)
-    haar_base_path = getattr(haar_data, "haarcascades", "")
-    face_cascade = cv2.CascadeClassifier(haar_base_path + "haarcascade_frontalface_default.xml")
-    faces = face_cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=5, minSize=(64, 64))
+    faces = (
+        FACE_CASCADE.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=5, minSize=(64, 64))
+        if FACE_CASCADE is not None
+        else ()
+    )
 
     image_area = float(gray.shape[0] * gray.shape[1])
     largest_face_ratio = max((w * h / image_area for (_, _, w, h) in faces), default=0.0)
@@ -435,6 +661,20 @@ def analyze_id_image(
         and quality["sharpness"] >= 45
     )
 
+    # OCR is by far the slowest stage; skip it when the cheap signals below
+    # already guarantee an Invalid result regardless of the name match.
+    already_rejected = (
+        selfie_signal
+        or (id_number and not id_format_valid)
+        or severe_blur
+        or screenshot_like_signal
+        or (low_text_presence and not has_document_shape)
+    )
+    if user_name and not already_rejected:
+        name_match_result = _match_name(_extract_text_from_image(image), user_name)
+    else:
+        name_match_result = None
+
     document_score = 0.0
     if has_document_shape:       document_score += 0.25
     if text_density >= 0.012:    document_score += 0.30
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 from typing import List
 
+# Tesseract uses OpenMP internally; with several uvicorn workers each spawning a
+# full thread team the CPU gets oversubscribed. Must be set before OCR loads.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 
-from .image_validator import analyze_id_image
+from .image_validator import analyze_id_image, create_http_client, fetch_image_bytes
 from .model import ModelArtifacts, bootstrap_model_if_missing, predict_invalid_probability
 from .schemas import (
     IDValidationRequest,
@@ -35,6 +40,7 @@ app.add_middleware(
 )
 
 app.state.model_artifacts = None
+app.state.http_client = None
 
 
 @app.on_event("startup")
@@ -47,6 +53,15 @@ def startup_event() -> None:
         logger.exception("Failed to initialize model: %s", exc)
         raise
 
+    app.state.http_client = create_http_client()
+
+
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    if app.state.http_client is not None:
+        await app.state.http_client.aclose()
+        app.state.http_client = None
+
 
 @app.get("/health")
 def health() -> dict:
@@ -62,11 +77,14 @@ def validate_id(payload: IDValidationRequest) -> IDValidationResponse:
 
         reasons = validate_id_rules(payload.id_number, payload.id_type)
 
-        invalid_probability = predict_invalid_probability(payload.id_number, model_artifacts)
-        ml_invalid_threshold = float(os.getenv("ML_INVALID_THRESHOLD", "0.50"))
+        # The ML check can only add a reason; once the rules have rejected the
+        # ID the outcome is already Invalid, so skip feature extraction + inference.
+        if not reasons:
+            invalid_probability = predict_invalid_probability(payload.id_number, model_artifacts)
+            ml_invalid_threshold = float(os.getenv("ML_INVALID_THRESHOLD", "0.50"))
 
-        if invalid_probability >= ml_invalid_threshold:
-            reasons.append("ML classifier flagged this ID as invalid.")
+            if invalid_probability >= ml_invalid_threshold:
+                reasons.append("ML classifier flagged this ID as invalid.")
 
         status = "Invalid" if reasons else "Valid"
         deduped_reasons = sorted(set(reasons))
@@ -80,30 +98,27 @@ def validate_id(payload: IDValidationRequest) -> IDValidationResponse:
 
 
 @app.post("/analyze-id-image", response_model=ImageValidationResponse)
-def analyze_id_image_endpoint(payload: ImageValidationRequest) -> ImageValidationResponse:
-    import sys
-    msg = f"\n{'='*60}\n🔥 API ENDPOINT CALLED\n{'='*60}\n"
-    msg += f"image_url: {payload.image_url[:80]}...\n"
-    msg += f"id_type: {payload.id_type}\n"
-    msg += f"user_name: {payload.user_name}\n"
-    msg += f"{'='*60}\n"
-    print(msg, flush=True)
-    sys.stdout.flush()
-    
+async def analyze_id_image_endpoint(payload: ImageValidationRequest) -> ImageValidationResponse:
     logger.info(f">>> API ENDPOINT CALLED: image_url={payload.image_url[:50]}..., id_type={payload.id_type}, user_name={payload.user_name}")
     try:
-        print("🔍 Calling analyze_id_image()...", flush=True)
-        result = analyze_id_image(payload.image_url, payload.id_type, payload.user_name)
-        print(f"✅ analyze_id_image() returned: status={result.status}, confidence={result.confidence}", flush=True)
-        return ImageValidationResponse(
+        image_bytes = await fetch_image_bytes(payload.image_url, app.state.http_client)
+        # OpenCV/OCR work is CPU-bound; keep it off the event loop.
+        result = await asyncio.to_thread(
+            analyze_id_image,
+            payload.image_url,
+            payload.id_type,
+            payload.user_name,
+            image_bytes=image_bytes,
+        )
+        logger.debug("analyze_id_image() returned: status=%s, confidence=%s", result.status, result.confidence)
+        # Fields are generated server-side, so skip the extra validation pass here;
+        # FastAPI still checks the response against response_model.
+        return ImageValidationResponse.model_construct(
             status=result.status,
             category=result.category,
             message=result.message,
             reasons=result.reasons,
-            checks=[
-                ImageAnalysisCheck(name=check["name"], status=check["status"], detail=check["detail"])
-                for check in result.checks
-            ],
+            checks=[ImageAnalysisCheck.model_construct(**check) for check in result.checks],
             confidence=result.confidence,
         )
     except Exception as exc:
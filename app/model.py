@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+import logging
 import math
-import random
+import os
 import string
+import uuid
+from collections import Counter
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+# API-server concurrency comes from uvicorn workers, not XGBoost threads: for
+# single-row predictions OpenMP thread spin-up costs far more than the trees.
+# Must be set before xgboost (and its OpenMP runtime) is loaded.
+os.environ.setdefault("OMP_NUM_THREADS", "1")
 
 import joblib
 import numpy as np
@@ -13,27 +24,81 @@ import pandas as pd
 from sklearn.model_selection import train_test_split
 from xgboost import XGBClassifier
 
-from .validator import normalize_id, validate_id_rules
+from .validator import is_valid_id_fast, normalize_id
 
-MODEL_PATH = Path("app/id_validator_model.joblib")
+try:
+    import tl2cgen
+    import treelite
+except Exception:
+    tl2cgen = None
+    treelite = None
+
+try:
+    import onnxmltools
+    import onnxruntime
+    from onnxmltools.convert.common.data_types import FloatTensorType
+except Exception:
+    onnxmltools = None
+    onnxruntime = None
 
+logger = logging.getLogger("kyc-id-validator")
+
+MODEL_PATH = Path("app/id_validator_model.joblib")
 
-@dataclass
+# Model input columns, in the order features are produced and stored.
+FEATURE_COLUMNS: Tuple[str, ...] = (
+    "length",
+    "digit_count",
+    "alpha_count",
+    "digit_ratio",
+    "alpha_ratio",
+    "unique_ratio",
+    "entropy",
+    "max_consecutive_run",
+    "prefix_is_alpha",
+    "suffix_is_digit",
+    "has_repeat_penalty",
+    "ascii_sum_mod_10",
+    "ascii_sum_mod_36",
+)
+EMPTY_FEATURES: Tuple[float, ...] = (0.0,) * len(FEATURE_COLUMNS)
+
+# bytes.translate() tables marking ASCII digits / letters with 1, for counting
+ASCII_DIGIT_TABLE = bytes(int(code < 128 and chr(code).isdigit()) for code in range(256))
+ASCII_ALPHA_TABLE = bytes(int(code < 128 and chr(code).isalpha()) for code in range(256))
+
+# Synthetic training data: valid-looking IDs are drawn from this alphabet
+# (letters first, then digits); invalid ones from a fixed set of bad inputs.
+VALID_ID_ALPHABET = np.frombuffer((string.ascii_uppercase + string.digits).encode("ascii"), dtype=np.uint8)
+FIRST_DIGIT_INDEX = len(string.ascii_uppercase)
+INVALID_ID_SAMPLES = ("", "123", "@@@@@@@", "AAAAAA111111111111", "NO_DIGITS_ID", "111111111111")
+
+# Number of distinct normalized IDs whose ML prediction is memoized.
+PREDICTION_CACHE_SIZE = 4096
+
+# IDs featurized and scored together by predict_invalid_probabilities.
+BATCH_PREDICTION_CHUNK_SIZE = 10_000
+
+
+# Identity-based equality/hash so artifacts can key the prediction cache; a
+# reloaded model is a new object and therefore never hits stale entries.
+@dataclass(eq=False)
 class ModelArtifacts:
     model: XGBClassifier
     feature_columns: List[str]
+    # Treelite-compiled copy of `model` for fast inference; None when unavailable.
+    native_predictor: object | None = None
+    # onnxruntime session over the ONNX export of `model`; None when unavailable.
+    onnx_session: object | None = None
 
 
-def _shannon_entropy(value: str) -> float:
-    if not value:
+def _shannon_entropy(char_counts: Iterable[int], length: int) -> float:
+    if not length:
         return 0.0
-    counts = {ch: value.count(ch) for ch in set(value)}
-    length = len(value)
-    entropy = 0.0
-    for count in counts.values():
-        p = count / length
-        entropy -= p * math.log2(p)
-    return entropy
+    # -sum((c/n) * log2(c/n)) == log2(n) - sum(c * log2(c)) / n
+    weighted = sum(count * math.log2(count) for count in char_counts)
+    # Clamp rounding noise (e.g. -8.9e-16) for single-character strings
+    return max(0.0, math.log2(length) - weighted / length)
 
 
 def _max_consecutive_run(value: str) -> int:
@@ -41,62 +106,131 @@ def _max_consecutive_run(value: str) -> int:
         return 0
     max_run = 1
     current = 1
-    for idx in range(1, len(value)):
-        if value[idx] == value[idx - 1]:
+    for previous, char in zip(value, value[1:]):
+        if char == previous:
             current += 1
-            max_run = max(max_run, current)
+            if current > max_run:
+                max_run = current
         else:
             current = 1
     return max_run
 
 
-def extract_features(id_number: str) -> Dict[str, float]:
-    normalized = normalize_id(id_number)
-
+def _feature_values(normalized: str) -> Tuple[float, ...]:
+    """Feature values for an already-normalized ID, in FEATURE_COLUMNS order."""
     if not normalized:
-        return {
-            "length": 0.0,
-            "digit_count": 0.0,
-            "alpha_count": 0.0,
-            "digit_ratio": 0.0,
-            "alpha_ratio": 0.0,
-            "unique_ratio": 0.0,
-            "entropy": 0.0,
-            "max_consecutive_run": 0.0,
-            "prefix_is_alpha": 0.0,
-            "suffix_is_digit": 0.0,
-            "has_repeat_penalty": 0.0,
-            "ascii_sum_mod_10": 0.0,
-            "ascii_sum_mod_36": 0.0,
-        }
+        return EMPTY_FEATURES
 
     length = len(normalized)
-    digit_count = sum(char.isdigit() for char in normalized)
-    alpha_count = sum(char.isalpha() for char in normalized)
-    unique_count = len(set(normalized))
-    ascii_sum = sum(ord(char) for char in normalized)
-    max_run = _max_consecutive_run(normalized)
-
-    return {
-        "length": float(length),
-        "digit_count": float(digit_count),
-        "alpha_count": float(alpha_count),
-        "digit_ratio": float(digit_count / length),
-        "alpha_ratio": float(alpha_count / length),
-        "unique_ratio": float(unique_count / length),
-        "entropy": float(_shannon_entropy(normalized)),
-        "max_consecutive_run": float(max_run),
-        "prefix_is_alpha": float(normalized[0].isalpha()),
-        "suffix_is_digit": float(normalized[-1].isdigit()),
-        "has_repeat_penalty": float(max_run >= 5),
-        "ascii_sum_mod_10": float(ascii_sum % 10),
-        "ascii_sum_mod_36": float(ascii_sum % 36),
+    # One histogram serves uniqueness, entropy and the run-length shortcut
+    char_counts = Counter(normalized)
+    unique_count = len(char_counts)
+    if normalized.isascii():
+        # C-level bytes passes instead of a Python call per character
+        encoded = normalized.encode("ascii")
+        digit_count = encoded.translate(ASCII_DIGIT_TABLE).count(1)
+        alpha_count = encoded.translate(ASCII_ALPHA_TABLE).count(1)
+        ascii_sum = sum(encoded)
+    else:
+        digit_count = sum(char.isdigit() for char in normalized)
+        alpha_count = sum(char.isalpha() for char in normalized)
+        ascii_sum = sum(ord(char) for char in normalized)
+    # A run can be no longer than its character's count: all-distinct IDs have runs of 1
+    max_run = 1 if unique_count == length else _max_consecutive_run(normalized)
+
+    return (
+        float(length),
+        float(digit_count),
+        float(alpha_count),
+        float(digit_count / length),
+        float(alpha_count / length),
+        float(unique_count / length),
+        float(_shannon_entropy(char_counts.values(), length)),
+        float(max_run),
+        float(normalized[0].isalpha()),
+        float(normalized[-1].isdigit()),
+        float(max_run >= 5),
+        float(ascii_sum % 10),
+        float(ascii_sum % 36),
+    )
+
+
+def extract_features(id_number: str) -> Dict[str, float]:
+    return dict(zip(FEATURE_COLUMNS, _feature_values(normalize_id(id_number))))
+
+
+def _ascii_feature_matrix(normalized_ids: List[str]) -> np.ndarray:
+    """
+    Vectorized equivalent of _feature_values for ASCII-only normalized IDs.
+    IDs are packed into a zero-padded (N, max_len) uint8 matrix and every
+    feature is computed with NumPy reductions along axis 1.
+    """
+    count = len(normalized_ids)
+    lengths = np.fromiter((len(value) for value in normalized_ids), dtype=np.int64, count=count)
+    max_len = max(int(lengths.max()), 1)
+    codes = np.frombuffer(
+        "".join(value.ljust(max_len, "\0") for value in normalized_ids).encode("ascii"),
+        dtype=np.uint8,
+    ).reshape(count, max_len)
+    positions = np.arange(max_len)
+    mask = positions < lengths[:, None]
+    non_empty = lengths > 0
+    safe_lengths = np.where(non_empty, lengths, 1)
+
+    is_digit = (codes >= 48) & (codes <= 57)
+    is_alpha = ((codes >= 65) & (codes <= 90)) | ((codes >= 97) & (codes <= 122))
+    digit_count = (is_digit & mask).sum(axis=1)
+    alpha_count = (is_alpha & mask).sum(axis=1)
+    ascii_sum = np.where(mask, codes, 0).sum(axis=1, dtype=np.int64)
+
+    # Per-row character histograms drive both uniqueness and entropy
+    row_index = np.broadcast_to(np.arange(count)[:, None], codes.shape)
+    histogram = np.bincount(
+        (row_index[mask] * 128 + codes[mask]).astype(np.int64), minlength=count * 128
+    ).reshape(count, 128)
+    unique_count = (histogram > 0).sum(axis=1)
+    probabilities = histogram / safe_lengths[:, None]
+    log_probabilities = np.log2(probabilities, out=np.zeros_like(probabilities), where=histogram > 0)
+    entropy = 0.0 - (probabilities * log_probabilities).sum(axis=1)
+
+    # Longest run: distance from each position back to the start of its run
+    run_starts = np.ones(codes.shape, dtype=bool)
+    run_starts[:, 1:] = codes[:, 1:] != codes[:, :-1]
+    last_start = np.maximum.accumulate(np.where(run_starts, positions, 0), axis=1)
+    max_run = np.where(mask, positions - last_start + 1, 0).max(axis=1)
+
+    last_char = codes[np.arange(count), np.maximum(lengths - 1, 0)]
+    columns = {
+        "length": lengths.astype(float),
+        "digit_count": digit_count.astype(float),
+        "alpha_count": alpha_count.astype(float),
+        "digit_ratio": np.where(non_empty, digit_count / safe_lengths, 0.0),
+        "alpha_ratio": np.where(non_empty, alpha_count / safe_lengths, 0.0),
+        "unique_ratio": np.where(non_empty, unique_count / safe_lengths, 0.0),
+        "entropy": entropy,
+        "max_consecutive_run": max_run.astype(float),
+        "prefix_is_alpha": (non_empty & is_alpha[:, 0]).astype(float),
+        "suffix_is_digit": (non_empty & ((last_char >= 48) & (last_char <= 57))).astype(float),
+        "has_repeat_penalty": (max_run >= 5).astype(float),
+        "ascii_sum_mod_10": (ascii_sum % 10).astype(float),
+        "ascii_sum_mod_36": (ascii_sum % 36).astype(float),
     }
+    return np.column_stack([columns[name] for name in FEATURE_COLUMNS])
+
+
+def extract_features_array(id_numbers: Iterable[str]) -> np.ndarray:
+    """(N, len(FEATURE_COLUMNS)) float64 feature matrix, shared by training and batch scoring."""
+    normalized_ids = [normalize_id(id_number) for id_number in id_numbers]
+    if not normalized_ids:
+        return np.empty((0, len(FEATURE_COLUMNS)))
+    if not all(value.isascii() for value in normalized_ids):
+        # Non-ASCII input needs the Unicode-aware per-ID path
+        return np.array([_feature_values(value) for value in normalized_ids], dtype=float)
+    return _ascii_feature_matrix(normalized_ids)
 
 
 def build_feature_frame(id_numbers: Iterable[str]) -> pd.DataFrame:
-    rows = [extract_features(id_number) for id_number in id_numbers]
-    return pd.DataFrame(rows)
+    return pd.DataFrame(extract_features_array(id_numbers), columns=list(FEATURE_COLUMNS))
 
 
 def train_model(training_df: pd.DataFrame, model_path: Path = MODEL_PATH) -> Dict[str, float]:
@@ -104,14 +238,15 @@ def train_model(training_df: pd.DataFrame, model_path: Path = MODEL_PATH) -> Dic
     if not required_columns.issubset(set(training_df.columns)):
         raise ValueError("Training DataFrame must contain 'id_number' and 'label' columns.")
 
-    dataset = training_df.copy()
-    dataset["label"] = dataset["label"].astype(int)
+    feature_frame = build_feature_frame(training_df["id_number"].tolist())
+    labels = training_df["label"].to_numpy(dtype=np.int32)
 
-    feature_frame = build_feature_frame(dataset["id_number"].tolist())
-    labels = dataset["label"].to_numpy(dtype=np.int32)
+    # Contiguous float32 matrix: XGBoost skips pandas dtype inspection and the
+    # float64 -> float32 conversion it would otherwise do internally.
+    feature_matrix = np.ascontiguousarray(feature_frame.to_numpy(dtype=np.float32))
 
     x_train, x_test, y_train, y_test = train_test_split(
-        feature_frame,
+        feature_matrix,
         labels,
         test_size=0.2,
         random_state=42,
@@ -127,6 +262,7 @@ def train_model(training_df: pd.DataFrame, model_path: Path = MODEL_PATH) -> Dic
         reg_lambda=1.0,
         objective="binary:logistic",
         eval_metric="logloss",
+        tree_method="hist",
         random_state=42,
         n_jobs=1,
     )
@@ -136,12 +272,90 @@ def train_model(training_df: pd.DataFrame, model_path: Path = MODEL_PATH) -> Dic
 
     artifacts: Dict[str, object] = {
         "model": classifier,
-        "feature_columns": list(feature_frame.columns),
+        "feature_columns": list(FEATURE_COLUMNS),
     }
     model_path.parent.mkdir(parents=True, exist_ok=True)
-    joblib.dump(artifacts, model_path)
+    # LZ4 keeps the artifact small while decompressing faster than zlib on
+    # worker start-up; joblib.load detects the compression automatically.
+    joblib.dump(artifacts, model_path, compress=("lz4", 3), protocol=5)
+
+    return {"test_accuracy": test_accuracy, "samples": float(len(training_df))}
+
+
+def native_library_path(model_path: Path = MODEL_PATH) -> Path:
+    return model_path.with_suffix(".so")
+
+
+@contextmanager
+def _atomic_output(path: Path) -> Iterator[Path]:
+    """
+    Yield a temporary path next to `path` and move it into place only once the
+    caller has finished writing it. Uvicorn workers export on start-up at the
+    same time, so none of them may ever open a half-written file.
+    The caller creates the file itself, so it gets the usual umask-based
+    permissions (mkstemp's 0600 would survive the rename).
+    """
+    temp_path = path.with_name(f".{path.stem}-{os.getpid()}-{uuid.uuid4().hex}{path.suffix}")
+    try:
+        yield temp_path
+        os.replace(temp_path, path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def export_native_predictor(model: XGBClassifier, lib_path: Path) -> None:
+    """Compile the trained trees to a shared library with Treelite/TL2cgen."""
+    tl_model = treelite.frontend.from_xgboost(model.get_booster())
+    with _atomic_output(lib_path) as temp_path:
+        tl2cgen.export_lib(tl_model, toolchain="gcc", libpath=str(temp_path), params={"parallel_comp": 8})
+
+
+def _load_native_predictor(model: XGBClassifier, model_path: Path) -> object | None:
+    if tl2cgen is None or treelite is None:
+        return None
+
+    lib_path = native_library_path(model_path)
+    try:
+        if not lib_path.exists() or lib_path.stat().st_mtime < model_path.stat().st_mtime:
+            export_native_predictor(model, lib_path)
+        return tl2cgen.Predictor(str(lib_path), nthread=1)
+    except Exception as exc:
+        logger.warning("Native predictor unavailable, falling back to XGBoost: %s", exc)
+        return None
+
+
+def onnx_model_path(model_path: Path = MODEL_PATH) -> Path:
+    return model_path.with_suffix(".onnx")
+
+
+def export_onnx_model(model: XGBClassifier, onnx_path: Path) -> None:
+    """Convert the trained trees to ONNX for serving with onnxruntime."""
+    # The converter only accepts positional feature names (f0, f1, ...);
+    # inputs are passed in FEATURE_COLUMNS order anyway.
+    booster = model.get_booster().copy()
+    booster.feature_names = None
+    onnx_model = onnxmltools.convert_xgboost(
+        booster, initial_types=[("input", FloatTensorType([None, len(FEATURE_COLUMNS)]))]
+    )
+    with _atomic_output(onnx_path) as temp_path:
+        temp_path.write_bytes(onnx_model.SerializeToString())
 
-    return {"test_accuracy": test_accuracy, "samples": float(len(dataset))}
+
+def _load_onnx_session(model: XGBClassifier, model_path: Path) -> object | None:
+    if onnxmltools is None or onnxruntime is None:
+        return None
+
+    onnx_path = onnx_model_path(model_path)
+    try:
+        if not onnx_path.exists() or onnx_path.stat().st_mtime < model_path.stat().st_mtime:
+            export_onnx_model(model, onnx_path)
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = 1
+        options.inter_op_num_threads = 1
+        return onnxruntime.InferenceSession(str(onnx_path), options, providers=["CPUExecutionProvider"])
+    except Exception as exc:
+        logger.warning("ONNX Runtime session unavailable, falling back to XGBoost: %s", exc)
+        return None
 
 
 def load_model(model_path: Path = MODEL_PATH) -> ModelArtifacts:
@@ -154,52 +368,108 @@ def load_model(model_path: Path = MODEL_PATH) -> ModelArtifacts:
 
     if model is None or feature_columns is None:
         raise ValueError("Saved model artifact is invalid.")
-
-    return ModelArtifacts(model=model, feature_columns=list(feature_columns))
+    if tuple(feature_columns) != FEATURE_COLUMNS:
+        raise ValueError("Saved model artifact was trained on a different feature set.")
+
+    # Single-threaded inference; see OMP_NUM_THREADS above
+    model.get_booster().set_param({"nthread": 1})
+
+    native_predictor = _load_native_predictor(model, model_path)
+    return ModelArtifacts(
+        model=model,
+        feature_columns=list(feature_columns),
+        native_predictor=native_predictor,
+        # Only needed when there is no compiled predictor to serve from
+        onnx_session=_load_onnx_session(model, model_path) if native_predictor is None else None,
+    )
 
 
 def predict_invalid_probability(id_number: str, artifacts: ModelArtifacts) -> float:
-    feature_frame = build_feature_frame([id_number])
-    aligned_frame = feature_frame.reindex(columns=artifacts.feature_columns, fill_value=0.0)
-    probability = float(artifacts.model.predict_proba(aligned_frame)[0][0])
-    return probability
-
-
-def _random_valid_id() -> str:
-    size = random.randint(8, 12)
-    body = [random.choice(string.ascii_uppercase + string.digits) for _ in range(size)]
-    if not any(ch.isdigit() for ch in body):
-        body[random.randrange(size)] = random.choice(string.digits)
-    return "".join(body)
-
-
-def _random_invalid_id() -> str:
-    generators = [
-        lambda: "",
-        lambda: "123",
-        lambda: "@@@@@@@",
-        lambda: "AAAAAA111111111111",
-        lambda: "NO_DIGITS_ID",
-        lambda: "111111111111",
-    ]
-    return random.choice(generators)()
-
-
-def generate_synthetic_training_data(samples: int = 4000) -> pd.DataFrame:
-    records: List[Tuple[str, int]] = []
-
-    for _ in range(samples // 2):
-        candidate = _random_valid_id()
-        label = 1 if len(validate_id_rules(candidate)) == 0 else 0
-        records.append((candidate, label))
-
-    for _ in range(samples // 2):
-        candidate = _random_invalid_id()
-        label = 1 if len(validate_id_rules(candidate)) == 0 else 0
-        records.append((candidate, label))
-
-    random.shuffle(records)
-    return pd.DataFrame(records, columns=["id_number", "label"])
+    # Features depend only on the normalized ID, so retries and resubmissions
+    # with different spacing/dashes/case share one cache entry.
+    return _cached_invalid_probability(normalize_id(id_number), artifacts)
+
+
+def _invalid_probabilities(features: np.ndarray, artifacts: ModelArtifacts) -> np.ndarray:
+    """P(invalid) for a float32 (N, n_features) matrix in FEATURE_COLUMNS order."""
+    if artifacts.native_predictor is not None:
+        # The compiled model outputs P(valid) for the positive class
+        valid_probabilities = np.ravel(artifacts.native_predictor.predict(tl2cgen.DMatrix(features)))
+    elif artifacts.onnx_session is not None:
+        # Outputs are (label, probabilities); column 1 is P(valid)
+        valid_probabilities = artifacts.onnx_session.run(None, {"input": features})[1][:, 1]
+    else:
+        valid_probabilities = artifacts.model.get_booster().inplace_predict(features)
+    # Same float32 arithmetic as predict_proba's class-0 column
+    return np.float32(1.0) - np.asarray(valid_probabilities, dtype=np.float32)
+
+
+@lru_cache(maxsize=PREDICTION_CACHE_SIZE)
+def _cached_invalid_probability(normalized_id: str, artifacts: ModelArtifacts) -> float:
+    # Single-row hot path: a (1, n_features) float32 array straight from the
+    # feature tuple (load_model guarantees the column order), no DataFrame.
+    # Allocated per call rather than shared, since requests run in a thread pool.
+    features = np.array([_feature_values(normalized_id)], dtype=np.float32)
+    return float(_invalid_probabilities(features, artifacts)[0])
+
+
+def predict_invalid_probabilities(id_numbers: Iterable[str], artifacts: ModelArtifacts) -> np.ndarray:
+    """
+    Batch counterpart of predict_invalid_probability for bulk validation:
+    vectorized feature matrices and one inference call per chunk of IDs.
+    """
+    # The vectorized featurizer's temporaries are ~4 KB per row, so bound them
+    # per chunk instead of materializing the whole upload at once.
+    id_iterator = iter(id_numbers)
+    chunks: List[np.ndarray] = []
+    while chunk := list(islice(id_iterator, BATCH_PREDICTION_CHUNK_SIZE)):
+        features = np.ascontiguousarray(extract_features_array(chunk), dtype=np.float32)
+        chunks.append(_invalid_probabilities(features, artifacts))
+    if not chunks:
+        return np.empty(0, dtype=np.float32)
+    return np.concatenate(chunks)
+
+
+def clear_prediction_cache() -> None:
+    """Drop cached predictions, e.g. after retraining or reloading the model."""
+    _cached_invalid_probability.cache_clear()
+
+
+def _random_valid_ids(rng: np.random.Generator, count: int) -> List[str]:
+    """8-12 random characters from A-Z0-9, with at least one digit per ID."""
+    sizes = rng.integers(8, 13, size=count)
+    char_indices = rng.integers(0, len(VALID_ID_ALPHABET), size=(count, 12))
+
+    within_size = np.arange(12) < sizes[:, None]
+    has_digit = ((char_indices >= FIRST_DIGIT_INDEX) & within_size).any(axis=1)
+    rows = np.flatnonzero(~has_digit)
+    positions = rng.integers(0, sizes[rows])
+    char_indices[rows, positions] = rng.integers(FIRST_DIGIT_INDEX, len(VALID_ID_ALPHABET), size=rows.size)
+
+    packed = VALID_ID_ALPHABET[char_indices].tobytes().decode("ascii")
+    return [packed[row * 12:row * 12 + size] for row, size in enumerate(sizes.tolist())]
+
+
+def _random_invalid_ids(rng: np.random.Generator, count: int) -> List[str]:
+    return [INVALID_ID_SAMPLES[index] for index in rng.integers(0, len(INVALID_ID_SAMPLES), size=count)]
+
+
+def generate_synthetic_training_data(samples: int = 4000, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    candidates = _random_valid_ids(rng, samples // 2) + _random_invalid_ids(rng, samples // 2)
+
+    # Invalid samples repeat a handful of values, so validate each distinct ID once
+    label_by_id = {candidate: int(is_valid_id_fast(candidate)) for candidate in set(candidates)}
+    labels = [label_by_id[candidate] for candidate in candidates]
+
+    order = rng.permutation(len(candidates))
+    return pd.DataFrame(
+        {
+            "id_number": [candidates[index] for index in order],
+            "label": [labels[index] for index in order],
+        },
+        columns=["id_number", "label"],
+    )
 
 
 def bootstrap_model_if_missing(model_path: Path = MODEL_PATH) -> ModelArtifacts:
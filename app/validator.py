@@ -1,9 +1,23 @@
 import re
-from typing import List
+from typing import Iterator, List
 
 ALLOWED_CHAR_PATTERN = re.compile(r"^[A-Za-z0-9\-\s]+$")
 MULTI_REPEAT_PATTERN = re.compile(r"(.)\1{4,}")
 
+# Byte classes for ASCII IDs, used with bytes.translate() in validate_id_rules.
+# Separators are the characters normalize_id strips (whitespace and "-").
+CHAR_DISALLOWED = b"\x00"
+CHAR_DIGIT = b"\x01"
+CHAR_ALPHA = b"\x02"
+CHAR_SEPARATOR = b"\x03"
+ASCII_CHAR_CLASSES = b"".join(
+    CHAR_DIGIT if chr(code).isdigit()
+    else CHAR_ALPHA if chr(code).isalpha()
+    else CHAR_SEPARATOR if chr(code).isspace() or chr(code) == "-"
+    else CHAR_DISALLOWED
+    for code in range(256)
+)
+
 SUPPORTED_ID_TYPES = {
     "Philippine Passport",
     "Driver's License",
@@ -20,10 +34,34 @@ SUPPORTED_ID_TYPES = {
     "National ID",
     "Others",
 }
+# str.translate() table deleting what normalize_id strips: "-" and every Unicode
+# whitespace character (same set as the regex \s; none lie above U+3000).
+ID_SEPARATOR_TABLE = str.maketrans("", "", "-" + "".join(chr(code) for code in range(0x3001) if chr(code).isspace()))
+
+# Type-specific format rules, compiled once: id_type -> (pattern, failure message)
+ID_TYPE_RULES = {
+    id_type: (re.compile(pattern), rule_message)
+    for id_type, (pattern, rule_message) in {
+        "Philippine Passport": (r"^[A-Z0-9]{8,9}$", "Passport number must be 8-9 alphanumeric characters."),
+        "Driver's License": (r"^[A-Z0-9]{9,20}$", "Driver's License number must be 9-20 alphanumeric characters."),
+        "SSS ID": (r"^\d{10}$", "SSS ID number must be exactly 10 digits."),
+        "GSIS ID": (r"^\d{8,13}$", "GSIS ID number must be 8-13 digits."),
+        "UMID": (r"^\d{10,13}$", "UMID number must be 10-13 digits."),
+        "PhilHealth ID": (r"^\d{12}$", "PhilHealth ID number must be exactly 12 digits."),
+        "TIN ID": (r"^(\d{9}|\d{12})$", "TIN ID number must be 9 or 12 digits."),
+        "Postal ID": (r"^[A-Z0-9]{6,20}$", "Postal ID number must be 6-20 alphanumeric characters."),
+        "Voter's ID": (r"^[A-Z0-9]{6,20}$", "Voter's ID number must be 6-20 alphanumeric characters."),
+        "PRC ID": (r"^[A-Z0-9]{6,20}$", "PRC ID number must be 6-20 alphanumeric characters."),
+        "Senior Citizen ID": (r"^[A-Z0-9]{6,20}$", "Senior Citizen ID number must be 6-20 alphanumeric characters."),
+        "PWD ID": (r"^[A-Z0-9]{6,20}$", "PWD ID number must be 6-20 alphanumeric characters."),
+        "National ID": (r"^\d{16}$", "National ID number must be exactly 16 digits."),
+        "Others": (r"^[A-Z0-9]{6,20}$", "ID number must be 6-20 alphanumeric characters."),
+    }.items()
+}
 
 
 def normalize_id(id_number: str) -> str:
-    return re.sub(r"[\s\-]", "", id_number or "").upper()
+    return (id_number or "").translate(ID_SEPARATOR_TABLE).upper()
 
 
 def _normalize_id_type(id_type: str | None) -> str:
@@ -45,58 +83,66 @@ def _normalize_id_type(id_type: str | None) -> str:
 def _validate_by_id_type(normalized_id: str, id_type: str) -> List[str]:
     reasons: List[str] = []
 
-    rules = {
-        "Philippine Passport": (r"^[A-Z0-9]{8,9}$", "Passport number must be 8-9 alphanumeric characters."),
-        "Driver's License": (r"^[A-Z0-9]{9,20}$", "Driver's License number must be 9-20 alphanumeric characters."),
-        "SSS ID": (r"^\d{10}$", "SSS ID number must be exactly 10 digits."),
-        "GSIS ID": (r"^\d{8,13}$", "GSIS ID number must be 8-13 digits."),
-        "UMID": (r"^\d{10,13}$", "UMID number must be 10-13 digits."),
-        "PhilHealth ID": (r"^\d{12}$", "PhilHealth ID number must be exactly 12 digits."),
-        "TIN ID": (r"^(\d{9}|\d{12})$", "TIN ID number must be 9 or 12 digits."),
-        "Postal ID": (r"^[A-Z0-9]{6,20}$", "Postal ID number must be 6-20 alphanumeric characters."),
-        "Voter's ID": (r"^[A-Z0-9]{6,20}$", "Voter's ID number must be 6-20 alphanumeric characters."),
-        "PRC ID": (r"^[A-Z0-9]{6,20}$", "PRC ID number must be 6-20 alphanumeric characters."),
-        "Senior Citizen ID": (r"^[A-Z0-9]{6,20}$", "Senior Citizen ID number must be 6-20 alphanumeric characters."),
-        "PWD ID": (r"^[A-Z0-9]{6,20}$", "PWD ID number must be 6-20 alphanumeric characters."),
-        "National ID": (r"^\d{16}$", "National ID number must be exactly 16 digits."),
-        "Others": (r"^[A-Z0-9]{6,20}$", "ID number must be 6-20 alphanumeric characters."),
-    }
-
-    pattern, rule_message = rules[id_type]
-    if not re.fullmatch(pattern, normalized_id):
+    pattern, rule_message = ID_TYPE_RULES[id_type]
+    if not pattern.fullmatch(normalized_id):
         reasons.append(rule_message)
 
     return reasons
 
 
-def validate_id_rules(id_number: str, id_type: str | None = None) -> List[str]:
-    reasons: List[str] = []
-
+def _rule_failures(id_number: str, id_type: str | None) -> Iterator[str]:
+    """
+    Yield the reason for each failed rule, in order. Checks run lazily, so a
+    consumer that stops at the first reason skips the remaining (regex) checks.
+    """
     raw_value = id_number or ""
     normalized = normalize_id(raw_value)
     normalized_id_type = _normalize_id_type(id_type)
 
     if not raw_value.strip():
-        reasons.append("ID number is required.")
-        return reasons
-
-    if not ALLOWED_CHAR_PATTERN.match(raw_value):
-        reasons.append("ID contains unsupported characters.")
+        yield "ID number is required."
+        return
+
+    if raw_value.isascii():
+        # One C-level pass classifies every character; for ASCII input a
+        # normalized ID is alphanumeric exactly when every character is allowed.
+        char_classes = raw_value.encode("ascii").translate(ASCII_CHAR_CLASSES)
+        chars_allowed = CHAR_DISALLOWED not in char_classes
+        is_alnum = chars_allowed
+        digit_count = char_classes.count(CHAR_DIGIT)
+    else:
+        chars_allowed = ALLOWED_CHAR_PATTERN.match(raw_value) is not None
+        is_alnum = normalized.isalnum()
+        digit_count = sum(ch.isdigit() for ch in normalized)
+
+    if not chars_allowed:
+        yield "ID contains unsupported characters."
 
     if normalized_id_type == "Others":
         if not (6 <= len(normalized) <= 20):
-            reasons.append("ID length must be between 6 and 20 characters.")
+            yield "ID length must be between 6 and 20 characters."
 
-    if normalized and not normalized.isalnum():
-        reasons.append("ID must be alphanumeric after normalization.")
+    if normalized and not is_alnum:
+        yield "ID must be alphanumeric after normalization."
 
-    if normalized and sum(ch.isdigit() for ch in normalized) < 2:
-        reasons.append("ID must contain at least one digit.")
+    if normalized and digit_count < 2:
+        yield "ID must contain at least one digit."
 
-    if normalized and MULTI_REPEAT_PATTERN.search(normalized):
-        reasons.append("ID contains excessive repeated characters.")
+    # A run of five identical characters needs at least five characters
+    if len(normalized) >= 5 and MULTI_REPEAT_PATTERN.search(normalized):
+        yield "ID contains excessive repeated characters."
 
     if normalized:
-        reasons.extend(_validate_by_id_type(normalized, normalized_id_type))
+        yield from _validate_by_id_type(normalized, normalized_id_type)
 
-    return reasons
+
+def validate_id_rules(id_number: str, id_type: str | None = None) -> List[str]:
+    return list(_rule_failures(id_number, id_type))
+
+
+def is_valid_id_fast(id_number: str, id_type: str | None = None) -> bool:
+    """
+    Same verdict as ``not validate_id_rules(id_number, id_type)``, for callers
+    that only need a boolean: stops at the first failing rule.
+    """
+    return next(_rule_failures(id_number, id_type), None) is None